@@ -7,10 +7,16 @@ Preserves save file integrity by patching values directly in pickle bytecode
 import sys
 import os
 import io
+import shutil
 import zipfile
 import base64
 import struct
+import multiprocessing
+import concurrent.futures
 import pickle
+import pickletools
+import re
+import functools
 import importlib
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -58,32 +64,118 @@ def _load_signing_keys(keys_path):
     return keys
 
 
-def _signatures_for_log(log_bytes):
-    """Create Ren'Py-compatible signatures string for given log, or b'' if unavailable."""
-    keys_path = _find_security_keys()
-    if not keys_path:
-        return b''
-    keys = _load_signing_keys(keys_path)
-    if not keys:
-        return b''
+# Parsed once and reused for every save: DER decoding and verifying-key
+# encoding are constant per key, only the signature depends on the log.
+_SIGNING_KEY_CACHE = None
+
+
+def _make_signer(der):
+    """Build (sign_callable, verifying-key DER, pure_python) for one DER
+    private key; pure_python tells whether the slow ecdsa fallback is in
+    use rather than the OpenSSL-backed `cryptography` library, whose
+    native scalar multiplication is orders of magnitude faster. Either
+    way the output matches python-ecdsa's defaults (SHA-1 digest, raw
+    r||s signature bytes), which is what Ren'Py's verifier expects.
+    Raises if the key can't be loaded by either backend."""
     try:
-        import ecdsa
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+        key = serialization.load_der_private_key(der, password=None)
+        if not isinstance(key, ec.EllipticCurvePrivateKey):
+            raise TypeError('not an EC private key')
+        vk_der = key.public_key().public_bytes(
+            serialization.Encoding.DER,
+            serialization.PublicFormat.SubjectPublicKeyInfo)
+        size = (key.curve.key_size + 7) // 8
+        algo = ec.ECDSA(hashes.SHA1())
+
+        def sign(data):
+            r, s = decode_dss_signature(key.sign(bytes(data), algo))
+            return r.to_bytes(size, 'big') + s.to_bytes(size, 'big')
+
+        return sign, vk_der, False
     except Exception:
-        return b''
+        pass
 
-    out_lines = []
-    for der in keys:
+    import ecdsa
+    sk = ecdsa.SigningKey.from_der(der)
+    vk = getattr(sk, 'verifying_key', None)
+    if vk is None:
+        raise ValueError('signing key has no verifying key')
+    # No explicit table precompute: python-ecdsa builds the generator's
+    # multiplication table lazily on first use, and from_der's verifying-key
+    # derivation above already triggered it, so signing from the cached key
+    # hits the precomputed table. RFC 6979 deterministic nonce; verifies the
+    # same as sk.sign() but skips gathering randomness.
+    return sk.sign_deterministic, vk.to_der(), True
+
+
+def _signing_keys():
+    """Load and parse signing keys on first use. Returns list of
+    (sign_callable, key DER, base64 verifying-key DER, pure_python)
+    tuples, possibly empty."""
+    global _SIGNING_KEY_CACHE
+    if _SIGNING_KEY_CACHE is not None:
+        return _SIGNING_KEY_CACHE
+
+    entries = []
+    keys_path = _find_security_keys()
+    for der in (_load_signing_keys(keys_path) if keys_path else []):
         try:
-            sk = ecdsa.SigningKey.from_der(der)
-            vk = getattr(sk, 'verifying_key', None)
-            if vk is None:
-                continue
-            sig = sk.sign(log_bytes)
-            vk_der = vk.to_der()
-            line = 'signature ' + base64.b64encode(vk_der).decode('ascii') + ' ' + base64.b64encode(sig).decode('ascii')
-            out_lines.append(line)
+            sign, vk_der, pure = _make_signer(der)
+            entries.append((sign, der, base64.b64encode(vk_der).decode('ascii'), pure))
         except Exception:
             continue
+    if entries:
+        # Only cache a successful load; with no usable keys yet, keep
+        # re-probing so keys installed mid-session get picked up.
+        _SIGNING_KEY_CACHE = entries
+    return entries
+
+
+def _sign_log_with_der(der, log_bytes):
+    """Sign the log with one DER-encoded key. Used as the process-pool
+    worker, so it reparses the key rather than sharing the cache."""
+    sign, _, _ = _make_signer(der)
+    return sign(log_bytes)
+
+
+def _signatures_for_log(log_bytes):
+    """Create Ren'Py-compatible signatures string for given log, or b'' if unavailable."""
+    entries = _signing_keys()
+    if not entries:
+        return b''
+
+    sigs = None
+    if len(entries) > 1 and any(pure for _, _, _, pure in entries):
+        # Fan the independent per-key signs out across processes, but only
+        # when GIL-bound pure-Python ecdsa is doing the signing: with the
+        # cryptography backend each sign is sub-millisecond and the pool
+        # spawn costs far more than it saves (seconds on a frozen exe).
+        try:
+            data = bytes(log_bytes)
+            workers = min(len(entries), os.cpu_count() or 1)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                sigs = list(pool.map(_sign_log_with_der,
+                                     [der for _, der, _, _ in entries],
+                                     [data] * len(entries)))
+        except Exception:
+            sigs = None
+
+    out_lines = []
+    if sigs is not None:
+        for (sign, der, vk_b64, pure), sig in zip(entries, sigs):
+            out_lines.append('signature ' + vk_b64 + ' ' + base64.b64encode(sig).decode('ascii'))
+    else:
+        for sign, der, vk_b64, pure in entries:
+            try:
+                sig = sign(log_bytes)
+                line = 'signature ' + vk_b64 + ' ' + base64.b64encode(sig).decode('ascii')
+                out_lines.append(line)
+            except Exception:
+                continue
     if not out_lines:
         return b''
     return ('\n'.join(out_lines) + '\n').encode('utf-8')
@@ -105,29 +197,26 @@ LONG4 = 0x8B
 BINSTRING = 0x54
 SHORT_BINSTRING = 0x55
 
+# Prebound Struct objects cache the format-string parse; unpack_from also
+# avoids allocating a slice per read.
+_U16 = struct.Struct('<H')
+_I32 = struct.Struct('<i')
+_U32 = struct.Struct('<I')
+_F64BE = struct.Struct('>d')
+
 
 # ============================================================================
 # Safe unpickler for reading save data
 # ============================================================================
 
-class _Proxy:
+class _Proxy(list):
+    # Subclassing list keeps append/extend/iteration on the C slots; the
+    # unpickler calls them once per item, so Python-level forwarders add up.
     def __init__(self, *a, **k):
+        list.__init__(self)
         self._state = None
-        self._list = []
     def __setstate__(self, state):
-        setattr(self, '_state', state)
-    def append(self, item):
-        self._list.append(item)
-    def extend(self, items):
-        try:
-            self._list.extend(items)
-        except Exception:
-            for it in items:
-                self._list.append(it)
-    def __iter__(self):
-        return iter(self._list)
-    def __len__(self):
-        return len(self._list)
+        self._state = state
 
 
 class _RevertableList(list):
@@ -187,125 +276,223 @@ class _SimpleOrderedDict(dict):
             pass
 
 
+# Keys interned to match the interned strings the unpickler hands to
+# find_class, keeping the tuple hash/compare on the fast pointer path.
 _SPECIAL = {
-    ('renpy.revertable', 'RevertableList'): _RevertableList,
-    ('renpy.revertable', 'RevertableDict'): _RevertableDict,
-    ('renpy.revertable', 'RevertableSet'): _RevertableSet,
-    ('collections', 'defaultdict'): _SimpleDefaultDict,
-    ('collections', 'OrderedDict'): _SimpleOrderedDict,
+    (sys.intern(mod), sys.intern(name)): cls
+    for (mod, name), cls in (
+        (('renpy.revertable', 'RevertableList'), _RevertableList),
+        (('renpy.revertable', 'RevertableDict'), _RevertableDict),
+        (('renpy.revertable', 'RevertableSet'), _RevertableSet),
+        (('collections', 'defaultdict'), _SimpleDefaultDict),
+        (('collections', 'OrderedDict'), _SimpleOrderedDict),
+    )
 }
 
+_REVERTABLE_BY_NAME = {
+    'RevertableList': _RevertableList,
+    'RevertableDict': _RevertableDict,
+    'RevertableSet': _RevertableSet,
+}
+
+_BUILTINS = importlib.import_module('builtins')
+
+# One proxy class per (module, name) pair; without this every GLOBAL
+# opcode for an unknown class allocated a fresh type object.
+_PROXY_CACHE = {}
+
 
 class SafeUnpickler(pickle.Unpickler):
     def find_class(self, module, name):
-        if (module, name) in _SPECIAL:
-            return _SPECIAL[(module, name)]
-        if name in ('RevertableList', 'RevertableDict', 'RevertableSet'):
-            mapping = {
-                'RevertableList': _RevertableList,
-                'RevertableDict': _RevertableDict,
-                'RevertableSet': _RevertableSet,
-            }
-            return mapping[name]
+        cls = _SPECIAL.get((module, name))
+        if cls is not None:
+            return cls
+        cls = _REVERTABLE_BY_NAME.get(name)
+        if cls is not None:
+            return cls
         if module == 'builtins':
-            return getattr(importlib.import_module(module), name)
-        return type(name, (_Proxy,), {})
+            return getattr(_BUILTINS, name)
+        key = (module, name)
+        cls = _PROXY_CACHE.get(key)
+        if cls is None:
+            cls = _PROXY_CACHE[key] = type(name, (_Proxy,), {})
+        return cls
 
 
 # ============================================================================
 # Value parsing and encoding
 # ============================================================================
 
-def _parse_value_at(data: bytes, pos: int):
-    """Parse a scalar value at the given position. Returns (value, end_pos, encoding_type) or None."""
-    n = len(data)
-    if pos >= n:
+def _build_decoders():
+    """Build the 256-entry opcode -> decoder table used by _parse_value_at.
+
+    Each decoder takes (data, pos, n) and returns (value, end_pos,
+    encoding_type) or None. The prebound unpack_from entry points skip
+    both the per-call format parse and the slice allocation the old
+    if/elif chain paid on every invocation."""
+    u16 = _U16.unpack_from
+    i32 = _I32.unpack_from
+    u32 = _U32.unpack_from
+    f64 = _F64BE.unpack_from
+
+    def binint1(data, pos, n):
+        if pos + 2 <= n:
+            return (data[pos + 1], pos + 2, 'BININT1')
         return None
-    op = data[pos]
-    
-    if op == BININT1 and pos + 2 <= n:
-        return (data[pos + 1], pos + 2, 'BININT1')
-    if op == BININT2 and pos + 3 <= n:
-        return (struct.unpack('<H', data[pos + 1:pos + 3])[0], pos + 3, 'BININT2')
-    if op == BININT and pos + 5 <= n:
-        return (struct.unpack('<i', data[pos + 1:pos + 5])[0], pos + 5, 'BININT')
-    if op == BINFLOAT and pos + 9 <= n:
-        return (struct.unpack('>d', data[pos + 1:pos + 9])[0], pos + 9, 'BINFLOAT')
-    if op == NEWTRUE:
+
+    def binint2(data, pos, n):
+        if pos + 3 <= n:
+            return (u16(data, pos + 1)[0], pos + 3, 'BININT2')
+        return None
+
+    def binint(data, pos, n):
+        if pos + 5 <= n:
+            return (i32(data, pos + 1)[0], pos + 5, 'BININT')
+        return None
+
+    def binfloat(data, pos, n):
+        if pos + 9 <= n:
+            return (f64(data, pos + 1)[0], pos + 9, 'BINFLOAT')
+        return None
+
+    def newtrue(data, pos, n):
         return (True, pos + 1, 'BOOL')
-    if op == NEWFALSE:
+
+    def newfalse(data, pos, n):
         return (False, pos + 1, 'BOOL')
-    if op == ord('I'):
+
+    def int_ascii(data, pos, n):
         end = data.find(b'\n', pos)
         if end != -1:
-            txt = data[pos + 1:end]
             try:
-                return (int(txt.decode('ascii')), end + 1, 'INT')
+                return (int(data[pos + 1:end].decode('ascii')), end + 1, 'INT')
             except Exception:
                 return None
-    if op == ord('F'):
+        return None
+
+    def float_ascii(data, pos, n):
         end = data.find(b'\n', pos)
         if end != -1:
-            txt = data[pos + 1:end]
             try:
-                return (float(txt.decode('ascii')), end + 1, 'FLOAT')
+                return (float(data[pos + 1:end].decode('ascii')), end + 1, 'FLOAT')
             except Exception:
                 return None
-    if op == LONG1 and pos + 2 <= n:
-        ln = data[pos + 1]
-        if pos + 2 + ln <= n:
-            mag = int.from_bytes(data[pos + 2:pos + 2 + ln], 'little', signed=True)
-            return (mag, pos + 2 + ln, 'LONG1')
-    if op == LONG4 and pos + 5 <= n:
-        ln = struct.unpack('<I', data[pos + 1:pos + 5])[0]
-        if pos + 5 + ln <= n:
-            mag = int.from_bytes(data[pos + 5:pos + 5 + ln], 'little', signed=True)
-            return (mag, pos + 5 + ln, 'LONG4')
-    if op == BINSTRING and pos + 5 <= n:
-        ln = struct.unpack('<I', data[pos + 1:pos + 5])[0]
-        if pos + 5 + ln <= n:
-            return (data[pos + 5:pos + 5 + ln].decode('latin1', 'replace'), pos + 5 + ln, 'BINSTRING')
-    if op == SHORT_BINSTRING and pos + 2 <= n:
-        ln = data[pos + 1]
-        if pos + 2 + ln <= n:
-            return (data[pos + 2:pos + 2 + ln].decode('latin1', 'replace'), pos + 2 + ln, 'SHORT_BINSTRING')
-    if op == ord('S'):
+        return None
+
+    def long1(data, pos, n):
+        if pos + 2 <= n:
+            ln = data[pos + 1]
+            if pos + 2 + ln <= n:
+                mag = int.from_bytes(data[pos + 2:pos + 2 + ln], 'little', signed=True)
+                return (mag, pos + 2 + ln, 'LONG1')
+        return None
+
+    def long4(data, pos, n):
+        if pos + 5 <= n:
+            ln = u32(data, pos + 1)[0]
+            if pos + 5 + ln <= n:
+                mag = int.from_bytes(data[pos + 5:pos + 5 + ln], 'little', signed=True)
+                return (mag, pos + 5 + ln, 'LONG4')
+        return None
+
+    def binstring(data, pos, n):
+        if pos + 5 <= n:
+            ln = u32(data, pos + 1)[0]
+            if pos + 5 + ln <= n:
+                return (data[pos + 5:pos + 5 + ln].decode('latin1', 'replace'), pos + 5 + ln, 'BINSTRING')
+        return None
+
+    def short_binstring(data, pos, n):
+        if pos + 2 <= n:
+            ln = data[pos + 1]
+            if pos + 2 + ln <= n:
+                return (data[pos + 2:pos + 2 + ln].decode('latin1', 'replace'), pos + 2 + ln, 'SHORT_BINSTRING')
+        return None
+
+    def string_ascii(data, pos, n):
         end = data.find(b'\n', pos)
         if end != -1:
-            txt = data[pos + 1:end]
             try:
-                s = txt.decode('ascii')
+                s = data[pos + 1:end].decode('ascii')
                 if s.startswith("'") and s.endswith("'"):
                     return (s[1:-1].replace("\\'", "'"), end + 1, 'STRING')
             except Exception:
                 return None
-    
-    return None
+        return None
+
+    table = [None] * 256
+    table[BININT1] = binint1
+    table[BININT2] = binint2
+    table[BININT] = binint
+    table[BINFLOAT] = binfloat
+    table[NEWTRUE] = newtrue
+    table[NEWFALSE] = newfalse
+    table[ord('I')] = int_ascii
+    table[ord('F')] = float_ascii
+    table[LONG1] = long1
+    table[LONG4] = long4
+    table[BINSTRING] = binstring
+    table[SHORT_BINSTRING] = short_binstring
+    table[ord('S')] = string_ascii
+    return table
+
+
+_DECODERS = _build_decoders()
+
+
+def _parse_value_at(data: bytes, pos: int):
+    """Parse a scalar value at the given position. Returns (value, end_pos, encoding_type) or None."""
+    n = len(data)
+    if pos >= n:
+        return None
+    dec = _DECODERS[data[pos]]
+    return dec(data, pos, n) if dec is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _key_bytes(key):
+    """Encoded form of a variable name. The same names recur on every
+    save in a session, so cache the latin1 bytes."""
+    return key.encode('latin1')
 
 
 def _encode_scalar(value):
     """Encode a scalar value into pickle bytecode."""
+    # Common values (booleans, small ints, short strings) repeat across
+    # edits; the cache key includes the type since True == 1 but the two
+    # encode differently.
+    if isinstance(value, (bool, int, float)) or (isinstance(value, str) and len(value) <= 64):
+        return _encode_scalar_cached(type(value), value)
+    return _encode_scalar_raw(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_scalar_cached(tp, value):
+    return _encode_scalar_raw(value)
+
+
+def _encode_scalar_raw(value):
     if isinstance(value, bool):
         return b"\x88" if value else b"\x89"
     if isinstance(value, int):
         if 0 <= value <= 0xFF:
             return b"\x4b" + bytes([value])
         if 0 <= value <= 0xFFFF:
-            return b"\x4d" + struct.pack('<H', value)
+            return b"\x4d" + _U16.pack(value)
         if -0x80000000 <= value <= 0x7FFFFFFF:
-            return b"\x4a" + struct.pack('<i', int(value))
+            return b"\x4a" + _I32.pack(int(value))
         # LONG4 for very large ints
         mag = int(value).to_bytes((int(value).bit_length() + 8) // 8 or 1, 'little', signed=True)
-        return b"\x8b" + struct.pack('<I', len(mag)) + mag
+        return b"\x8b" + _U32.pack(len(mag)) + mag
     if isinstance(value, float):
-        return b"\x47" + struct.pack('>d', value)
+        return b"\x47" + _F64BE.pack(value)
     if isinstance(value, str):
         # Use BINSTRING for strings
         encoded = value.encode('latin1', 'replace')
         if len(encoded) <= 255:
             return b"\x55" + bytes([len(encoded)]) + encoded
         else:
-            return b"\x54" + struct.pack('<I', len(encoded)) + encoded
+            return b"\x54" + _U32.pack(len(encoded)) + encoded
     raise ValueError(f'Unsupported type for encoding: {type(value)}')
 
 
@@ -313,12 +500,126 @@ def _encode_scalar(value):
 # Save file operations
 # ============================================================================
 
+# Opcode names (from pickletools) grouped for the store.* scanner.
+_STRING_OP_NAMES = frozenset({
+    'BINUNICODE', 'SHORT_BINUNICODE', 'BINUNICODE8', 'UNICODE',
+    'BINSTRING', 'SHORT_BINSTRING', 'STRING',
+})
+_MEMO_OP_NAMES = frozenset({'BINPUT', 'LONG_BINPUT', 'PUT', 'MEMOIZE'})
+_SCALAR_OP_NAMES = frozenset({
+    'BININT1', 'BININT2', 'BININT', 'INT', 'LONG', 'LONG1', 'LONG4',
+    'BINFLOAT', 'FLOAT', 'NEWTRUE', 'NEWFALSE',
+}) | _STRING_OP_NAMES
+
+
+def scan_log(log_bytes):
+    """Collect scalar `store.*` variables by walking the pickle opcode
+    stream, without materializing any objects. Mirrors the matching rule
+    of the patch path: a store.* string followed (after optional memo
+    opcodes) by a scalar opcode.
+
+    One fused pass returns both the values and where they live:
+    ``(variables, offsets)``, with ``offsets[key] = (start, end)`` being
+    the byte range of the key's first scalar value in ``log_bytes``, so
+    the save path can splice replacements without rescanning."""
+    variables = {}
+    offsets = {}
+    pending_key = None
+    pending_value = None  # (key, value, value_start) awaiting the next op's pos
+    # Bound to locals: this loop runs once per opcode over the whole log,
+    # and global/attribute lookups inside it are measurable.
+    memo_ops = _MEMO_OP_NAMES
+    scalar_ops = _SCALAR_OP_NAMES
+    string_ops = _STRING_OP_NAMES
+    for opcode, arg, pos in pickletools.genops(log_bytes):
+        name = opcode.name
+        if pending_value is not None:
+            # The next opcode's position bounds the previous value
+            key, value, vstart = pending_value
+            pending_value = None
+            if key not in variables:
+                # First occurrence wins, same as the patch path
+                variables[key] = value
+                offsets[key] = (vstart, pos)
+        if pending_key is not None:
+            if name in memo_ops:
+                continue
+            key = pending_key
+            pending_key = None
+            if name in scalar_ops:
+                if name == 'NEWTRUE':
+                    value = True
+                elif name == 'NEWFALSE':
+                    value = False
+                else:
+                    value = arg
+                if isinstance(value, (int, float, bool, str)):
+                    pending_value = (key, value, pos)
+                    # This opcode is spoken for as a value; a store.*
+                    # string value must not double as the next key, or
+                    # editing the phantom entry would rewrite whatever
+                    # follows it in the stream.
+                    continue
+        if name in string_ops and isinstance(arg, str) and arg.startswith('store.'):
+            pending_key = arg
+    return variables, offsets
+
+
+def _apply_offset_patches(log_bytes, updates, offsets):
+    """Splice new values into the byte ranges recorded by scan_log; no
+    rescan of the log, each edit only shifts the tail bytes a length
+    change actually moves. Raises KeyError when a value can't be
+    encoded."""
+    edits = []
+    for key, value in updates.items():
+        start, end = offsets[key]
+        try:
+            rep = _encode_scalar(value)
+        except ValueError as e:
+            raise KeyError(f"Cannot encode value for {key}: {e}")
+        edits.append((start, end, rep))
+    edits.sort()
+
+    out = bytearray(log_bytes)
+    delta = 0
+    for start, end, rep in edits:
+        out[start + delta:end + delta] = rep
+        delta += len(rep) - (end - start)
+    return bytes(out)
+
+
+def _read_log(zf):
+    """Decompress the log member straight into one exact-size bytearray.
+
+    zf.read() accumulates chunk fragments and joins them at the end,
+    roughly doubling peak memory for a big log; readinto on a
+    preallocated buffer keeps a single copy live. (The member is
+    DEFLATE-compressed, so mapping it from disk isn't an option.)"""
+    info = zf.getinfo('log')
+    log = bytearray(info.file_size)
+    with zf.open(info) as f:
+        read = f.readinto(log)
+    if read != len(log):
+        del log[read:]
+    return log
+
+
 def load_save_variables(save_path):
-    """Load all editable variables from a save file. Returns dict of {key: value}."""
+    """Load all editable variables from a save file. Returns
+    (variables, log, offsets); offsets is empty when only the unpickler
+    fallback could read the file."""
     with zipfile.ZipFile(save_path, 'r') as zf:
-        log = zf.read('log')
-    
-    # Try to load using SafeUnpickler
+        log = _read_log(zf)
+
+    # Walk the opcode stream directly; no proxy objects get built
+    try:
+        variables, offsets = scan_log(log)
+        if variables:
+            return variables, log, offsets
+    except Exception:
+        pass
+
+    # Fall back to materializing the roots dict with SafeUnpickler
     try:
         roots, _ = SafeUnpickler(io.BytesIO(log)).load()
         if isinstance(roots, dict):
@@ -329,83 +630,129 @@ def load_save_variables(save_path):
                     # Only include simple editable types
                     if isinstance(v, (int, float, bool, str)):
                         variables[k] = v
-            return variables, log
+            return variables, log, {}
     except Exception as e:
         messagebox.showerror("Error", f"Failed to load save file:\n{str(e)}")
-        return {}, None
-    
-    return {}, None
+        return {}, None, {}
 
+    return {}, None, {}
 
-def patch_variable_in_log(log_bytes, key, new_value):
-    """Patch a variable value directly in the pickle bytecode."""
-    key_b = key.encode('latin1')  # Use latin1 to match pickle string encoding
-    i = 0
-    n = len(log_bytes)
-    matches_found = 0
-    
-    while i < n:
-        idx = log_bytes.find(key_b, i)
-        if idx == -1:
+
+def _key_needles(key_b):
+    """Build search needles (opcode + length prefix + key bytes) for every
+    string encoding the key may use in the pickle stream. Prefixing the
+    opcode and length means bytes.find does all the candidate filtering in
+    a single C-level scan, instead of re-checking bytes around every
+    substring hit in Python."""
+    needles = []
+    if len(key_b) <= 0xFF:
+        needles.append(bytes([SHORT_BINSTRING, len(key_b)]) + key_b)
+    len4 = _U32.pack(len(key_b))
+    needles.append(bytes([BINSTRING]) + len4 + key_b)
+    needles.append(bytes([BINUNICODE]) + len4 + key_b)
+    return needles
+
+
+# Consumes a run of BINPUT 'q' (0x71) / LONG_BINPUT 'r' (0x72) memo
+# opcodes in one C-level match. DOTALL so '.' also covers 0x0A bytes.
+_MEMO_RE = re.compile(rb'(?:\x71.|\x72.{4})*', re.DOTALL)
+
+
+def patch_variables_in_log(log_bytes, updates):
+    """Patch several variable values in one left-to-right pass over the
+    pickle bytecode. ``updates`` maps variable name -> new value.
+
+    All needles are combined into one alternation pattern so the whole
+    log is scanned once, however many variables changed, instead of one
+    full scan per variable."""
+    if not updates:
+        return log_bytes
+
+    needle_to_key = {}
+    for key in updates:
+        key_b = _key_bytes(key)  # latin1, matching pickle string encoding
+        for needle in _key_needles(key_b):
+            needle_to_key[needle] = key
+    pattern = re.compile(b'|'.join(re.escape(nd) for nd in needle_to_key))
+
+    edits = []  # (value_start, value_end, replacement) in stream order
+    consumed = 0  # end of the last value claimed by an edit
+    remaining = set(updates)
+    seen = set()
+
+    for m in pattern.finditer(log_bytes):
+        if m.start() < consumed:
+            # Hit inside a value we already replaced
+            continue
+        key = needle_to_key[m.group(0)]
+        seen.add(key)
+        if key not in remaining:
+            continue
+        # Skip optional memo opcodes (BINPUT/LONG_BINPUT) in one match
+        pos = _MEMO_RE.match(log_bytes, m.end()).end()
+
+        # The value should be right after the key (and optional memo ops)
+        pv = _parse_value_at(log_bytes, pos)
+        if pv is None:
+            continue
+        cur, vend, enc = pv
+        # Found the value - replace it
+        try:
+            rep = _encode_scalar(updates[key])
+        except ValueError as e:
+            raise KeyError(f"Cannot encode value for {key}: {e}")
+        edits.append((pos, vend, rep))
+        consumed = vend
+        remaining.discard(key)
+        if not remaining:
             break
-        
-        # Check for different string encodings
-        matched = False
-        pos = idx + len(key_b)
-        
-        # Check SHORT_BINSTRING (0x55 'U' + 1 byte length)
-        if idx >= 2 and log_bytes[idx - 2] == 0x55:
-            ln = log_bytes[idx - 1]
-            if ln == len(key_b):
-                matched = True
-                matches_found += 1
-        
-        # Check BINSTRING (0x54 'T' + 4 byte length)
-        elif idx >= 5 and log_bytes[idx - 5] == 0x54:
-            ln = struct.unpack('<I', log_bytes[idx - 4:idx])[0]
-            if ln == len(key_b):
-                matched = True
-                matches_found += 1
-        
-        # Check BINUNICODE (0x58 'X' + 4 byte length)
-        elif idx >= 5 and log_bytes[idx - 5] == 0x58:
-            ln = struct.unpack('<I', log_bytes[idx - 4:idx])[0]
-            if ln == len(key_b):
-                matched = True
-                matches_found += 1
-        
-        if matched:
-            # Skip optional memo opcodes
-            # BINPUT 'q' (0x71)
-            while pos < n and log_bytes[pos] == 0x71:
-                pos += 2
-            # LONG_BINPUT 'r' (0x72)
-            while pos < n and log_bytes[pos] == 0x72:
-                pos += 5
-            
-            # The value should be right after the key (and optional memo ops)
-            pv = _parse_value_at(log_bytes, pos)
-            if pv is not None:
-                cur, vend, enc = pv
-                # Found the value - replace it
-                try:
-                    rep = _encode_scalar(new_value)
-                    return log_bytes[:pos] + rep + log_bytes[vend:]
-                except ValueError as e:
-                    raise KeyError(f"Cannot encode value for {key}: {e}")
-        
-        i = idx + 1
-    
-    if matches_found == 0:
-        raise KeyError(f"Variable not found in pickle bytecode: {key}")
-    else:
-        raise KeyError(f"Variable '{key}' found {matches_found} time(s) but value encoding not recognized")
+
+    if remaining:
+        missing = sorted(k for k in remaining if k not in seen)
+        if missing:
+            raise KeyError(f"Variable not found in pickle bytecode: {', '.join(missing)}")
+        raise KeyError(f"Variable(s) found but value encoding not recognized: {', '.join(sorted(remaining))}")
+
+    # Splice into one shared bytearray; each edit moves only the bytes a
+    # length change actually shifts, instead of copying the whole log per
+    # variable via slice concatenation.
+    out = bytearray(log_bytes)
+    delta = 0
+    for pos, vend, rep in edits:
+        out[pos + delta:vend + delta] = rep
+        delta += len(rep) - (vend - pos)
+    return bytes(out)
+
+
+def patch_variable_in_log(log_bytes, key, new_value):
+    """Patch a single variable value directly in the pickle bytecode."""
+    return patch_variables_in_log(log_bytes, {key: new_value})
+
+
+def _optimize_log(log_bytes):
+    """Strip pickle memo puts that are never referenced again, shrinking the
+    log before it gets compressed and signed. Returns the original bytes
+    unchanged if the stream doesn't parse cleanly or carries trailing data
+    beyond the STOP opcode."""
+    try:
+        ops = list(pickletools.genops(log_bytes))
+        if not ops or ops[-1][0].name != 'STOP' or ops[-1][2] + 1 != len(log_bytes):
+            return log_bytes
+        out = pickletools.optimize(log_bytes)
+        return out if len(out) < len(log_bytes) else log_bytes
+    except Exception:
+        return log_bytes
 
 
 def save_modified_save(src_path, dst_path, modified_log):
     """Save modified log back to a new save file, regenerating signatures."""
+    modified_log = _optimize_log(modified_log)
     with zipfile.ZipFile(src_path, 'r') as zin:
-        with zipfile.ZipFile(dst_path, 'w', compression=zipfile.ZIP_DEFLATED) as zout:
+        # Level-1 DEFLATE: Ren'Py doesn't care about the compression level,
+        # and the default level spends most of the save-as time squeezing a
+        # few percent out of a multi-MB log.
+        with zipfile.ZipFile(dst_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=1) as zout:
             for item in zin.infolist():
                 if item.filename == 'log':
                     # Write modified log
@@ -413,7 +760,10 @@ def save_modified_save(src_path, dst_path, modified_log):
                     zi.date_time = item.date_time
                     zi.compress_type = zipfile.ZIP_DEFLATED
                     zi.external_attr = item.external_attr
-                    zout.writestr(zi, modified_log)
+                    # compresslevel must be repeated here: writestr only
+                    # applies the archive-level default when it builds the
+                    # ZipInfo itself from a name string.
+                    zout.writestr(zi, modified_log, compresslevel=1)
                 elif item.filename == 'signatures':
                     # Regenerate signatures for the new log
                     sig = _signatures_for_log(modified_log)
@@ -421,9 +771,12 @@ def save_modified_save(src_path, dst_path, modified_log):
                     zi.date_time = item.date_time
                     zi.compress_type = zipfile.ZIP_DEFLATED
                     zi.external_attr = item.external_attr
-                    zout.writestr(zi, sig)
+                    zout.writestr(zi, sig, compresslevel=1)
                 else:
-                    zout.writestr(item, zin.read(item.filename))
+                    # Stream untouched members through a 1 MiB buffer
+                    # instead of materializing each one in memory first.
+                    with zin.open(item, 'r') as src, zout.open(item, 'w') as dst:
+                        shutil.copyfileobj(src, dst, length=1 << 20)
 
 
 # ============================================================================
@@ -440,6 +793,12 @@ class RenpySaveEditorGUI:
         self.original_log = None
         self.variables = {}
         self.modified_variables = {}
+        self._offsets = {}
+        self._sorted_keys = []
+        self._keys_lower = []
+        self._filter_job = None
+        self._filtered = []
+        self._populated = 0
         
         self.create_widgets()
     
@@ -490,12 +849,13 @@ class RenpySaveEditorGUI:
         self.tree.column('value', width=200)
         self.tree.column('type', width=100)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
+        # Scrollbar; yscrollcommand goes through _on_tree_scroll so rows
+        # can be paged in as the user nears the bottom
+        self.scrollbar = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind double-click to edit
         self.tree.bind('<Double-Button-1>', self.on_double_click)
@@ -516,13 +876,14 @@ class RenpySaveEditorGUI:
             return
         
         try:
-            self.variables, self.original_log = load_save_variables(filename)
+            self.variables, self.original_log, self._offsets = load_save_variables(filename)
             if not self.variables:
                 messagebox.showwarning("Warning", "No editable variables found in save file.")
                 return
             
             self.current_file = filename
             self.modified_variables = {}
+            self._rebuild_key_index()
             self.populate_tree()
             self.status_var.set(f"Loaded: {os.path.basename(filename)} ({len(self.variables)} variables)")
             self.save_btn['state'] = 'normal'
@@ -530,29 +891,61 @@ class RenpySaveEditorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load save file:\n{str(e)}")
     
+    def _rebuild_key_index(self):
+        # Sorted and case-folded once per load; the filter reuses these
+        # instead of re-sorting and re-lowering every key per keystroke.
+        self._sorted_keys = sorted(self.variables)
+        self._keys_lower = [k.lower() for k in self._sorted_keys]
+
+    # Rows inserted per batch; the rest page in on scroll instead of
+    # being inserted up front.
+    _PAGE_SIZE = 200
+
     def populate_tree(self):
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add variables
+        self.tree.delete(*self.tree.get_children())
+
+        # Resolve the filter against the cached index; only the first
+        # page of matches goes into the tree right away
         filter_text = self.filter_var.get().lower()
-        for key in sorted(self.variables.keys()):
-            if filter_text and filter_text not in key.lower():
-                continue
-            
+        if filter_text:
+            self._filtered = [k for k, kl in zip(self._sorted_keys, self._keys_lower) if filter_text in kl]
+        else:
+            self._filtered = self._sorted_keys
+        self._populated = 0
+        self._insert_next_page()
+
+        # Configure tag colors
+        self.tree.tag_configure('modified', background='yellow')
+
+    def _insert_next_page(self):
+        end = min(self._populated + self._PAGE_SIZE, len(self._filtered))
+        for key in self._filtered[self._populated:end]:
             value = self.modified_variables.get(key, self.variables[key])
             value_type = type(value).__name__
-            
+
             # Highlight modified variables
             tags = ('modified',) if key in self.modified_variables else ()
-            
+
             self.tree.insert('', tk.END, values=(key, value, value_type), tags=tags)
-        
-        # Configure tag colors
-        self.tree.tag_configure('modified', background='yellow')
+        self._populated = end
+
+    def _on_tree_scroll(self, first, last):
+        # Page in the next batch once the view nears the bottom, then
+        # forward to the scrollbar as usual
+        if float(last) > 0.9 and self._populated < len(self._filtered):
+            self._insert_next_page()
+        self.scrollbar.set(first, last)
     
     def apply_filter(self):
+        # Debounce: typing fires the trace per keystroke, and each rebuild
+        # is O(N) Tk inserts. Only the last pending rebuild runs.
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(150, self._apply_filter_now)
+
+    def _apply_filter_now(self):
+        self._filter_job = None
         self.populate_tree()
     
     def on_double_click(self, event):
@@ -635,10 +1028,13 @@ class RenpySaveEditorGUI:
             return
         
         try:
-            # Apply all modifications to the log
-            modified_log = self.original_log
-            for key, value in self.modified_variables.items():
-                modified_log = patch_variable_in_log(modified_log, key, value)
+            # Apply all modifications to the log. With offsets from the
+            # load-time scan the edits splice straight in; otherwise fall
+            # back to a single patching pass over the log.
+            if self._offsets and all(k in self._offsets for k in self.modified_variables):
+                modified_log = _apply_offset_patches(self.original_log, self.modified_variables, self._offsets)
+            else:
+                modified_log = patch_variables_in_log(self.original_log, self.modified_variables)
             
             # Save to new file
             save_modified_save(self.current_file, filename, modified_log)
@@ -660,4 +1056,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Needed for the signing process pool inside the PyInstaller exe
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file